@@ -15,7 +15,7 @@ from flask_cors import CORS
 import threading
 import queue
 
-from mlx_controller import MLXController, GenerationParams, process_generation_request
+from mlx_controller import MLXController, GenerationParams, process_generation_request, COMMON_MODELS
 
 logging.basicConfig(
     level=logging.INFO,
@@ -42,23 +42,8 @@ def health_check():
 
 @app.route('/models', methods=['GET'])
 def list_models():
-    common_models = [
-        "mlx-community/Qwen2.5-0.5B-Instruct-4bit",
-        "mlx-community/Qwen2.5-1.5B-Instruct-4bit", 
-        "mlx-community/Qwen2.5-3B-Instruct-4bit",
-        "mlx-community/DeepSeek-R1-0528-Qwen3-8B-4bit",
-        "mlx-community/deepseek-coder-1.3b-instruct-mlx",
-        "mlx-community/deepseek-coder-6.7b-instruct-hf-4bit-mlx",
-        "mlx-community/Mistral-7B-Instruct-v0.3-4bit",
-        "mlx-community/Llama-3.2-1B-Instruct-4bit",
-        "mlx-community/Llama-3.2-3B-Instruct-4bit",
-        "mlx-community/gemma-2-2b-it-4bit",
-        "mlx-community/Phi-3.5-mini-instruct-4bit",
-        "microsoft/Phi-3.5-mini-instruct"
-    ]
-    
     return jsonify({
-        "available_models": common_models,
+        "available_models": COMMON_MODELS,
         "current_model": controller.model_name,
         "model_loaded": controller.model_loaded
     })
@@ -75,7 +60,7 @@ def load_model():
         
         logger.info(f"Loading model: {model_path}")
         
-        success = controller.load_model(model_path, tokenizer_config)
+        success = controller.load_model(model_path, tokenizer_config, draft_model=data.get('draft_model_path'))
         
         if success:
             return jsonify({
@@ -124,7 +109,7 @@ def generate_text():
         if not params.validate():
             return jsonify({"error": "Parameter validation failed"}), 400
         
-        result = controller.generate_text(messages, params)
+        result = controller.generate_text(messages, params, data.get('system_prefix_id'))
         
         return jsonify({
             "success": True,
@@ -241,6 +226,19 @@ def get_default_parameters():
                 "type": "float",
                 "range": [1.0, 2.0],
                 "description": "Penalize repetitive tokens"
+            },
+            "greedy": {
+                "type": "bool",
+                "description": "Always pick the most likely token. Ignores temperature, top_p and top_k"
+            },
+            "speculative": {
+                "type": "bool",
+                "description": "Use the draft model loaded via draft_model_path to propose tokens"
+            },
+            "num_draft_tokens": {
+                "type": "int",
+                "range": [1, 16],
+                "description": "Tokens proposed by the draft model per step"
             }
         }
     })
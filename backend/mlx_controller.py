@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union, Any, Generator
 import threading
 from dataclasses import dataclass, asdict
+from collections import OrderedDict
 
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.NotOpenSSLWarning)
@@ -15,6 +16,7 @@ warnings.filterwarnings("ignore", message="urllib3.*")
 import mlx.core as mx
 from mlx_lm import load, generate, stream_generate
 from mlx_lm.sample_utils import make_sampler
+from mlx_lm.models.cache import make_prompt_cache, can_trim_prompt_cache, trim_prompt_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +28,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max system prefixes whose prefilled KV caches are kept in memory
+PREFIX_CACHE_SIZE = 4
+
+# Models offered to clients by the /models endpoints
+COMMON_MODELS = (
+    "mlx-community/Qwen2.5-0.5B-Instruct-4bit",
+    "mlx-community/Qwen2.5-1.5B-Instruct-4bit",
+    "mlx-community/Qwen2.5-3B-Instruct-4bit",
+    "mlx-community/DeepSeek-R1-0528-Qwen3-8B-4bit",
+    "mlx-community/deepseek-coder-1.3b-instruct-mlx",
+    "mlx-community/deepseek-coder-6.7b-instruct-hf-4bit-mlx",
+    "mlx-community/Mistral-7B-Instruct-v0.3-4bit",
+    "mlx-community/Llama-3.2-1B-Instruct-4bit",
+    "mlx-community/Llama-3.2-3B-Instruct-4bit",
+    "mlx-community/gemma-2-2b-it-4bit",
+    "mlx-community/Phi-3.5-mini-instruct-4bit",
+    "microsoft/Phi-3.5-mini-instruct"
+)
+
 class MLXControllerError(Exception):
     def __init__(self, message, context=None):
         super().__init__(message)
@@ -47,6 +68,9 @@ class GenerationParams:
     stream: bool = False
     verbose: bool = True
     filter_asian_chars: bool = False
+    greedy: bool = False
+    speculative: bool = False
+    num_draft_tokens: int = 4
     
     def __post_init__(self):
         if self.stop_sequences is None:
@@ -63,6 +87,7 @@ class GenerationParams:
             assert self.max_length > 0, "Max length must be > 0"
             assert self.repetition_penalty >= 1.0, "Repetition penalty must be >= 1.0"
             assert 0.0 <= self.min_p <= 1.0, "Min-p must be between 0.0 and 1.0"
+            assert 1 <= self.num_draft_tokens <= 16, "Draft tokens must be between 1 and 16"
             return True
         except AssertionError as e:
             logger.error(f"Parameter validation failed: {e}")
@@ -134,10 +159,15 @@ class MLXController:
         self.tokenizer = None
         self.model_name = None
         self.model_loaded = False
+        self.draft_model = None
+        self.draft_model_name = None
         self._generation_lock = threading.Lock()
+        # Prefilled KV caches for shared system prompts: id -> (prefix tokens, cache)
+        self._prefix_caches = OrderedDict()
         logger.info("MLXController initialized")
     
-    def load_model(self, model_path: str, tokenizer_config: Optional[Dict] = None) -> bool:
+    def load_model(self, model_path: str, tokenizer_config: Optional[Dict] = None, warmup: bool = True,
+                   draft_model: Optional[str] = None) -> bool:
         try:
             logger.info(f"Loading model: {model_path}")
             start_time = time.time()
@@ -161,9 +191,18 @@ class MLXController:
             
             self.model_name = model_path
             self.model_loaded = True
+            self._prefix_caches.clear()
+            
+            self.draft_model = None
+            self.draft_model_name = None
+            if draft_model:
+                self._load_draft_model(draft_model)
             
             load_time = time.time() - start_time
             logger.info(f"Model loaded successfully in {load_time:.2f}s: {model_path}")
+            
+            if warmup:
+                self._warmup()
             return True
             
         except Exception as e:
@@ -176,12 +215,43 @@ class MLXController:
             logger.error(f"Failed to load model {model_path}: {error_msg}")
             raise MLXControllerError(f"Model loading failed: {error_msg}")
     
+    def _load_draft_model(self, draft_model: str):
+        # Small model sharing the main model's tokenizer, used to propose
+        # tokens for speculative decoding; failure leaves it disabled
+        try:
+            logger.info(f"Loading draft model: {draft_model}")
+            self.draft_model, _ = load(draft_model)
+            self.draft_model_name = draft_model
+            logger.info(f"Draft model loaded: {draft_model}")
+        except Exception as e:
+            logger.warning(f"Failed to load draft model {draft_model}, speculative decoding disabled: {e}")
+    
+    def _warmup(self):
+        # Tiny generation so the first real request doesn't pay for graph
+        # compilation and kernel specialization
+        try:
+            start_time = time.time()
+            with self._generation_lock:
+                generate(
+                    self.model,
+                    self.tokenizer,
+                    prompt=self._prepare_prompt([{"role": "user", "content": "hi"}]),
+                    max_tokens=4,
+                    verbose=False
+                )
+            logger.info(f"🔥 Model warmed in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+    
     def unload_model(self):
         try:
             self.model = None
             self.tokenizer = None
             self.model_name = None
             self.model_loaded = False
+            self.draft_model = None
+            self.draft_model_name = None
+            self._prefix_caches.clear()
             logger.info("Model unloaded successfully")
         except Exception as e:
             logger.error(f"Error during model unload: {e}")
@@ -190,28 +260,14 @@ class MLXController:
         return {
             "loaded": self.model_loaded,
             "model_name": self.model_name,
-            "model_type": type(self.model).__name__ if self.model else None
+            "model_type": type(self.model).__name__ if self.model else None,
+            "draft_model_name": self.draft_model_name
         }
     
     def get_available_models(self) -> Dict[str, Any]:
         """Return list of available models - exact copy from working v1"""
-        common_models = [
-            "mlx-community/Qwen2.5-0.5B-Instruct-4bit",
-            "mlx-community/Qwen2.5-1.5B-Instruct-4bit", 
-            "mlx-community/Qwen2.5-3B-Instruct-4bit",
-            "mlx-community/DeepSeek-R1-0528-Qwen3-8B-4bit",
-            "mlx-community/deepseek-coder-1.3b-instruct-mlx",
-            "mlx-community/deepseek-coder-6.7b-instruct-hf-4bit-mlx",
-            "mlx-community/Mistral-7B-Instruct-v0.3-4bit",
-            "mlx-community/Llama-3.2-1B-Instruct-4bit",
-            "mlx-community/Llama-3.2-3B-Instruct-4bit",
-            "mlx-community/gemma-2-2b-it-4bit",
-            "mlx-community/Phi-3.5-mini-instruct-4bit",
-            "microsoft/Phi-3.5-mini-instruct"
-        ]
-        
         return {
-            "available_models": common_models,
+            "available_models": COMMON_MODELS,
             "current_model": self.model_name,
             "model_loaded": self.model_loaded
         }
@@ -244,7 +300,65 @@ class MLXController:
             logger.error(f"Error preparing prompt: {e}")
             raise MLXControllerError(f"Prompt preparation failed: {e}")
     
+    def _encode_prompt(self, prompt: str) -> List[int]:
+        # Chat templates usually include the BOS token already
+        bos_token = getattr(self.tokenizer, "bos_token", None)
+        add_special_tokens = bos_token is None or not prompt.startswith(bos_token)
+        return self.tokenizer.encode(prompt, add_special_tokens=add_special_tokens)
+    
+    def _get_prefix_cache(self, messages: List[Dict[str, str]], prompt: str, system_prefix_id: str):
+        """Return (remaining prompt tokens, prompt cache, prefix length) with the leading system messages prefilled"""
+        system_messages = []
+        for msg in messages:
+            if msg.get("role") != "system":
+                break
+            system_messages.append(msg)
+        
+        if not system_messages or not hasattr(self.tokenizer, 'apply_chat_template'):
+            return None
+        
+        prefix = self.tokenizer.apply_chat_template(
+            system_messages,
+            tokenize=False,
+            add_generation_prompt=False
+        )
+        if not prompt.startswith(prefix):
+            return None
+        
+        tokens = self._encode_prompt(prompt)
+        prefix_tokens = self._encode_prompt(prefix)
+        if len(tokens) <= len(prefix_tokens) or tokens[:len(prefix_tokens)] != prefix_tokens:
+            return None
+        
+        cached = self._prefix_caches.get(system_prefix_id)
+        if cached is not None and cached[0] == prefix_tokens:
+            self._prefix_caches.move_to_end(system_prefix_id)
+            return tokens[len(prefix_tokens):], cached[1], len(prefix_tokens)
+        
+        cache = make_prompt_cache(self.model)
+        if not can_trim_prompt_cache(cache):
+            return None
+        
+        self.model(mx.array(prefix_tokens)[None], cache=cache)
+        mx.eval([c.state for c in cache])
+        self._prefix_caches[system_prefix_id] = (prefix_tokens, cache)
+        self._prefix_caches.move_to_end(system_prefix_id)
+        while len(self._prefix_caches) > PREFIX_CACHE_SIZE:
+            self._prefix_caches.popitem(last=False)
+        logger.info(f"Cached system prefix '{system_prefix_id}' ({len(prefix_tokens)} tokens)")
+        
+        return tokens[len(prefix_tokens):], cache, len(prefix_tokens)
+    
+    def _speculative_kwargs(self, params: GenerationParams) -> Dict[str, Any]:
+        if params.speculative and self.draft_model is not None:
+            return {"draft_model": self.draft_model, "num_draft_tokens": params.num_draft_tokens}
+        return {}
+    
     def _create_sampler(self, params: GenerationParams):
+        # Greedy decoding skips temperature, top-p and top-k entirely
+        if params.greedy:
+            return lambda logits: mx.argmax(logits, axis=-1)
+        
         try:
             sampler_kwargs = {
                 "temp": params.temperature,
@@ -262,7 +376,8 @@ class MLXController:
             logger.error(f"Error creating sampler: {e}")
             raise MLXControllerError(f"Sampler creation failed: {e}")
     
-    def generate_text(self, messages: List[Dict[str, str]], params: GenerationParams) -> Dict[str, Any]:
+    def generate_text(self, messages: List[Dict[str, str]], params: GenerationParams,
+                      system_prefix_id: Optional[str] = None) -> Dict[str, Any]:
         if not self.model_loaded:
             raise MLXControllerError("No model loaded")
         
@@ -277,14 +392,31 @@ class MLXController:
                 prompt = self._prepare_prompt(messages)
                 sampler = self._create_sampler(params)
                 
-                response = generate(
-                    self.model,
-                    self.tokenizer,
-                    prompt=prompt,
-                    sampler=sampler,
-                    max_tokens=params.max_length,
-                    verbose=params.verbose
-                )
+                # Reuse the prefilled KV cache of a shared system prompt if requested;
+                # speculative decoding needs a cache covering the draft model too
+                prompt_input = prompt
+                generate_kwargs = self._speculative_kwargs(params)
+                prefixed = None
+                if system_prefix_id and not generate_kwargs:
+                    prefixed = self._get_prefix_cache(messages, prompt, system_prefix_id)
+                if prefixed:
+                    prompt_input, generate_kwargs["prompt_cache"], prefix_length = prefixed
+                
+                try:
+                    response = generate(
+                        self.model,
+                        self.tokenizer,
+                        prompt=prompt_input,
+                        sampler=sampler,
+                        max_tokens=params.max_length,
+                        verbose=params.verbose,
+                        **generate_kwargs
+                    )
+                finally:
+                    if prefixed:
+                        # Roll the cache back to the shared prefix for the next call
+                        cache = generate_kwargs["prompt_cache"]
+                        trim_prompt_cache(cache, cache[0].offset - prefix_length)
                 
                 # Apply Asian character filter if requested
                 if params.filter_asian_chars:
@@ -330,7 +462,8 @@ class MLXController:
                     self.tokenizer,
                     prompt=prompt,
                     sampler=sampler,
-                    max_tokens=params.max_length
+                    max_tokens=params.max_length,
+                    **self._speculative_kwargs(params)
                 ):
                     token_count += 1
                     full_response += token.text
@@ -9,18 +9,27 @@ import json
 import logging
 import sqlite3
 import os
+import re
+import sys
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass
 import argparse
+import atexit
 import aiohttp
-import hashlib
+import secrets
+import signal
 import requests
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # MCP Protocol Types following Anthropic specification
 @dataclass
@@ -52,18 +61,68 @@ class AIRoutingConfig:
     ai_host: str = "localhost"
     ai_port: int = 8000
     timeout: int = 10
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ai_enabled": self.ai_enabled,
+            "ai_host": self.ai_host,
+            "ai_port": self.ai_port,
+            "timeout": self.timeout
+        }
+
+# Message write statement, kept constant so sqlite3's statement cache reuses it
+INSERT_MESSAGE_SQL = "INSERT INTO messages (conversation_id, role, content, tokens) VALUES (?, ?, ?, ?)"
+
+# Max conversations whose active injections are kept in memory
+INJECTION_CACHE_SIZE = 1024
+
+# Greetings and acknowledgements that carry no context worth storing
+LOW_SIGNAL_PATTERN = re.compile(r'^(ok|okay|thanks|thx|sure|yes|no|hi|hello|👍)\W*$', re.IGNORECASE)
+
+def _low_signal(text: str) -> bool:
+    """Check if text is too short or generic to be useful context"""
+    stripped = text.strip()
+    return len(stripped) < 4 or LOW_SIGNAL_PATTERN.match(stripped) is not None
 
 class ContextDatabase:
     """SQLite database for context persistence"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, flush_every: int = 1, flush_interval: float = 2.0,
+                 durable: bool = True):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Throwaway databases (tests) skip fsync and keep the journal in memory
+        self.durable = durable
+        self._write_lock = threading.Lock()
+        
+        # Messages are buffered per conversation and written in batches of
+        # flush_every, or after flush_interval seconds, whichever comes first
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, List[Tuple[str, str, int]]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        
+        # Active injection cache, invalidated by bumping a per-conversation version
+        self._cache_lock = threading.Lock()
+        self._injection_cache = OrderedDict()
+        self._injection_versions: Dict[str, int] = {}
+        
         self.init_database()
+        self._counts = self._load_counts()
+        atexit.register(self.flush_all, retry=False)
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self.durable:
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
     
     def init_database(self):
         """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.executescript('''
                 CREATE TABLE IF NOT EXISTS conversations (
                     id TEXT PRIMARY KEY,
@@ -103,77 +162,223 @@ class ContextDatabase:
                     FOREIGN KEY (conversation_id) REFERENCES conversations (id)
                 );
                 
-                CREATE INDEX IF NOT EXISTS idx_messages_conversation 
-                ON messages(conversation_id, timestamp);
+                DROP INDEX IF EXISTS idx_messages_conversation;
+                CREATE INDEX IF NOT EXISTS idx_messages_conv_ts_id_desc 
+                ON messages(conversation_id, timestamp DESC, id DESC);
                 CREATE INDEX IF NOT EXISTS idx_injections_conversation 
                 ON context_injections(conversation_id, priority DESC);
+                
+                CREATE TRIGGER IF NOT EXISTS touch_conversation
+                AFTER INSERT ON messages
+                BEGIN
+                    UPDATE conversations SET updated_at = CURRENT_TIMESTAMP
+                    WHERE id = NEW.conversation_id;
+                END;
             ''')
     
+    def _load_counts(self) -> Dict[str, int]:
+        """Seed row counters with one query at startup"""
+        with self._connect() as conn:
+            conversations, messages, injections = conn.execute("""
+                SELECT (SELECT COUNT(*) FROM conversations),
+                       (SELECT COUNT(*) FROM messages),
+                       (SELECT COUNT(*) FROM context_injections)
+            """).fetchone()
+        return {"conversations": conversations, "messages": messages, "injections": injections}
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get row counts, writing buffered messages first"""
+        self.flush_all()
+        with self._write_lock:
+            return dict(self._counts)
+    
     def create_conversation(self, name: str, metadata: Dict = None) -> str:
         """Create new conversation"""
-        conv_id = hashlib.md5(f"{name}_{datetime.now()}".encode()).hexdigest()[:16]
-        with sqlite3.connect(self.db_path) as conn:
+        conv_id = secrets.token_hex(8)
+        with self._write_lock, self._connect() as conn:
             conn.execute(
                 "INSERT INTO conversations (id, name, metadata) VALUES (?, ?, ?)",
-                (conv_id, name, json.dumps(metadata or {}))
+                (conv_id, name, json.dumps(metadata) if metadata else None)
             )
+            self._counts["conversations"] += 1
         return conv_id
     
     def add_message(self, conversation_id: str, role: str, content: str, tokens: int = 0):
         """Add message to conversation"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO messages (conversation_id, role, content, tokens) VALUES (?, ?, ?, ?)",
-                (conversation_id, role, content, tokens)
-            )
-            # Update conversation timestamp
-            conn.execute(
-                "UPDATE conversations SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (conversation_id,)
+        self.add_messages(conversation_id, [(role, content, tokens)])
+    
+    def add_messages(self, conversation_id: str, rows: List[Tuple[str, str, int]]):
+        """Add (role, content, tokens) rows to conversation, buffering up to flush_every"""
+        if self.flush_every <= 1:
+            self._write_messages(conversation_id, rows)
+            return
+        
+        with self._pending_lock:
+            pending = self._pending.setdefault(conversation_id, [])
+            pending.extend(rows)
+            if len(pending) >= self.flush_every:
+                self._write_messages(conversation_id, pending)
+                del self._pending[conversation_id]
+            elif self._flush_timer is None:
+                self._start_flush_timer()
+    
+    def _start_flush_timer(self):
+        """Schedule a flush of all buffered messages; caller holds _pending_lock"""
+        self._flush_timer = threading.Timer(self.flush_interval, self.flush_all)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def flush(self, conversation_id: str) -> int:
+        """Write buffered messages for one conversation, returning how many"""
+        with self._pending_lock:
+            rows = self._pending.get(conversation_id)
+            if not rows:
+                return 0
+            self._write_messages(conversation_id, rows)
+            del self._pending[conversation_id]
+            return len(rows)
+    
+    def flush_all(self, retry: bool = True) -> int:
+        """Write all buffered messages, returning how many; failed writes are retried later if retry"""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # Rows stay buffered until written, so one failing conversation
+            # doesn't lose the others
+            written = 0
+            for conversation_id, rows in list(self._pending.items()):
+                try:
+                    self._write_messages(conversation_id, rows)
+                except sqlite3.Error as e:
+                    logging.getLogger(__name__).error(f"Failed to flush messages for {conversation_id}: {e}")
+                    continue
+                del self._pending[conversation_id]
+                written += len(rows)
+            if self._pending and retry:
+                self._start_flush_timer()
+            return written
+    
+    def _write_messages(self, conversation_id: str, rows: List[Tuple[str, str, int]]):
+        """Insert message rows in a single transaction"""
+        # conversations.updated_at is maintained by the touch_conversation trigger
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                INSERT_MESSAGE_SQL,
+                [(conversation_id, role, content, tokens) for role, content, tokens in rows]
             )
+            self._counts["messages"] += len(rows)
+    
+    def _query_history(self, conn: sqlite3.Connection, columns: str,
+                       conversation_id: str, limit: Optional[int]) -> List:
+        """Select columns of a conversation's messages, oldest first"""
+        if not limit:
+            return conn.execute(f"""
+                SELECT {columns} FROM messages 
+                WHERE conversation_id = ? 
+                ORDER BY timestamp, id
+            """, (conversation_id,)).fetchall()
+        
+        # Newest-first window via the descending index, returned oldest-first
+        return conn.execute(f"""
+            SELECT {columns} FROM (
+                SELECT * FROM messages 
+                WHERE conversation_id = ? 
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            ) ORDER BY timestamp, id
+        """, (conversation_id, limit)).fetchall()
     
     def get_conversation_history(self, conversation_id: str, limit: int = None) -> List[Dict]:
         """Get conversation history with optional limit"""
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush(conversation_id)
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
-            query = """
-                SELECT role, content, timestamp, tokens 
-                FROM messages 
-                WHERE conversation_id = ? 
-                ORDER BY timestamp DESC
-            """
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            rows = conn.execute(query, (conversation_id,)).fetchall()
-            return [dict(row) for row in reversed(rows)]
+            rows = self._query_history(conn, "role, content, timestamp, tokens", conversation_id, limit)
+            return [dict(row) for row in rows]
+    
+    def get_history_rc(self, conversation_id: str, limit: int = None) -> List[Tuple[str, str]]:
+        """Get (role, content) pairs of conversation history, oldest first"""
+        self.flush(conversation_id)
+        with self._connect() as conn:
+            return self._query_history(conn, "role, content", conversation_id, limit)
     
     def add_context_injection(self, conversation_id: str, injection_type: str, 
                             content: str, priority: int = 0) -> str:
         """Add context injection"""
-        injection_id = hashlib.md5(f"{conversation_id}_{injection_type}_{datetime.now()}".encode()).hexdigest()[:16]
-        with sqlite3.connect(self.db_path) as conn:
+        injection_id = secrets.token_hex(8)
+        with self._write_lock, self._connect() as conn:
             conn.execute(
                 "INSERT INTO context_injections (id, conversation_id, type, content, priority) VALUES (?, ?, ?, ?, ?)",
                 (injection_id, conversation_id, injection_type, content, priority)
             )
+            self._counts["injections"] += 1
+        with self._cache_lock:
+            self._injection_versions[conversation_id] = self._injection_versions.get(conversation_id, 0) + 1
         return injection_id
     
     def get_active_injections(self, conversation_id: str) -> List[Dict]:
         """Get active context injections for conversation"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 "SELECT * FROM context_injections WHERE conversation_id = ? AND active = 1 ORDER BY priority DESC",
                 (conversation_id,)
             ).fetchall()
             return [dict(row) for row in rows]
+    
+    def get_active_injection_contents(self, conversation_id: str, injection_type: str = None) -> List[str]:
+        """Get only the content of active context injections, highest priority first"""
+        key = (conversation_id, injection_type)
+        with self._cache_lock:
+            version = self._injection_versions.get(conversation_id, 0)
+            cached = self._injection_cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._injection_cache.move_to_end(key)
+                return list(cached[1])
+        
+        query = "SELECT content FROM context_injections WHERE conversation_id = ? AND active = 1"
+        args = (conversation_id,)
+        if injection_type:
+            query += " AND type = ?"
+            args += (injection_type,)
+        query += " ORDER BY priority DESC"
+        
+        with self._connect() as conn:
+            contents = [row[0] for row in conn.execute(query, args)]
+        
+        with self._cache_lock:
+            self._injection_cache[key] = (version, contents)
+            self._injection_cache.move_to_end(key)
+            while len(self._injection_cache) > INJECTION_CACHE_SIZE:
+                self._injection_cache.popitem(last=False)
+        return list(contents)
+    
+    def list_conversations(self) -> List[Dict]:
+        """List conversations, most recently active first"""
+        # updated_at only moves when messages are written, so write buffered ones first
+        self.flush_all()
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT id, name, created_at FROM conversations ORDER BY updated_at DESC"
+            ).fetchall()
+            return [dict(row) for row in rows]
+    
+    def set_context_window(self, conversation_id: str, window_size: int, strategy: str = "recent"):
+        """Store the context window configuration of a conversation"""
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO context_windows (id, conversation_id, window_size, strategy) VALUES (?, ?, ?, ?)",
+                (conversation_id, conversation_id, window_size, strategy)
+            )
 
 class MCPContextServer:
     """MCP Context Server following Anthropic's specification"""
     
-    def __init__(self, db_path: str, llm_port: int = 8000):
-        self.db = ContextDatabase(db_path)
+    def __init__(self, db_path: str, llm_port: int = 8000, flush_every: int = 1,
+                 durable: bool = True):
+        self.db = ContextDatabase(db_path, flush_every=flush_every, durable=durable)
         self.llm_port = llm_port
         self.llm_base_url = f"http://localhost:{llm_port}"
         self.routing = AIRoutingConfig(ai_port=llm_port)
@@ -228,19 +433,13 @@ class MCPContextServer:
         resources = []
         
         # Add conversation resources
-        with sqlite3.connect(self.db.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            conversations = conn.execute(
-                "SELECT id, name, created_at FROM conversations ORDER BY updated_at DESC"
-            ).fetchall()
-            
-            for conv in conversations:
-                resources.append({
-                    "uri": f"context://conversation/{conv['id']}",
-                    "name": f"Conversation: {conv['name']}",
-                    "description": f"Context from conversation {conv['name']} (created {conv['created_at']})",
-                    "mimeType": "application/json"
-                })
+        for conv in self.db.list_conversations():
+            resources.append({
+                "uri": f"context://conversation/{conv['id']}",
+                "name": f"Conversation: {conv['name']}",
+                "description": f"Context from conversation {conv['name']} (created {conv['created_at']})",
+                "mimeType": "application/json"
+            })
         
         return {"resources": resources}
     
@@ -347,10 +546,19 @@ class MCPContextServer:
                         "type": "text",
                         "text": f"Created conversation: {conv_id}"
                     }],
+                    "structuredContent": {"conversation_id": conv_id},
                     "isError": False
                 }
             
             elif tool_name == "add_context_injection":
+                if _low_signal(arguments["content"]):
+                    return {
+                        "content": [{
+                            "type": "text",
+                            "text": "Context injection rejected: content is too short or carries no context"
+                        }],
+                        "isError": True
+                    }
                 injection_id = self.db.add_context_injection(
                     arguments["conversation_id"],
                     arguments["type"],
@@ -382,11 +590,11 @@ class MCPContextServer:
             
             elif tool_name == "manage_context_window":
                 # Store window configuration
-                with sqlite3.connect(self.db.db_path) as conn:
-                    conn.execute(
-                        "INSERT OR REPLACE INTO context_windows (id, conversation_id, window_size, strategy) VALUES (?, ?, ?, ?)",
-                        (arguments["conversation_id"], arguments["conversation_id"], arguments["window_size"], arguments.get("strategy", "recent"))
-                    )
+                self.db.set_context_window(
+                    arguments["conversation_id"],
+                    arguments["window_size"],
+                    arguments.get("strategy", "recent")
+                )
                 return {
                     "content": [{
                         "type": "text", 
@@ -414,33 +622,51 @@ class MCPContextServer:
                 "isError": True
             }
     
+    async def handle_request(self, request: Dict) -> Dict:
+        """Route a single JSON-RPC request to its MCP method handler"""
+        try:
+            method = request.get("method", "")
+            params = request.get("params", {})
+            
+            # Route MCP methods
+            if method == "initialize":
+                result = await self.handle_initialize(params)
+            elif method == "resources/list":
+                result = await self.handle_resources_list(params)
+            elif method == "resources/read":
+                result = await self.handle_resources_read(params)
+            elif method == "tools/list":
+                result = await self.handle_tools_list(params)
+            elif method == "tools/call":
+                result = await self.handle_tools_call(params)
+            else:
+                result = {"error": f"Unknown method: {method}"}
+            
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "result": result
+            }
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id") if isinstance(request, dict) else None,
+                "error": {"code": -32603, "message": str(e)}
+            }
+    
     async def generate_with_context(self, conversation_id: str, message: str, 
                                   window_size: int = 10, temperature: float = 0.7) -> str:
         """Generate LLM response with managed context"""
         # Get conversation history
-        history = self.db.get_conversation_history(conversation_id, window_size)
-        
-        # Get active context injections
-        injections = self.db.get_active_injections(conversation_id)
+        history = self.db.get_history_rc(conversation_id, window_size)
         
-        # Build context-aware messages
-        messages = []
+        # Get active system context injections
+        system_injections = self.db.get_active_injection_contents(conversation_id, "system")
         
-        # Add context injections as system messages
-        for injection in injections:
-            if injection['type'] == 'system':
-                messages.append({
-                    "role": "system",
-                    "content": injection['content']
-                })
-        
-        # Add conversation history
-        messages.extend([
-            {"role": msg["role"], "content": msg["content"]} 
-            for msg in history
-        ])
-        
-        # Add current message
+        # Build context-aware messages: injections as system messages,
+        # then conversation history, then the current message
+        messages = [{"role": "system", "content": content} for content in system_injections]
+        messages += [{"role": role, "content": content} for role, content in history]
         messages.append({"role": "user", "content": message})
         
         # Send to LLM
@@ -460,9 +686,13 @@ class MCPContextServer:
                         result = await response.json()
                         llm_response = result.get("text", "")
                         
-                        # Store in database
-                        self.db.add_message(conversation_id, "user", message)
-                        self.db.add_message(conversation_id, "assistant", llm_response)
+                        # Store the exchange as a pair so history keeps alternating
+                        # user/assistant turns; skip it only when the user turn is trivial
+                        if not _low_signal(message):
+                            self.db.add_messages(conversation_id, [
+                                ("user", message, 0),
+                                ("assistant", llm_response, 0),
+                            ])
                         
                         return llm_response
                     else:
@@ -505,6 +735,16 @@ class MCPContextServer:
                 }
             })
         
+        @app.route('/stats', methods=['GET'])
+        def stats():
+            """Conversation, message and injection counts"""
+            return jsonify(self.db.get_stats())
+        
+        @app.route('/flush', methods=['POST'])
+        def flush():
+            """Write buffered messages to the database"""
+            return jsonify({"flushed": self.db.flush_all()})
+        
         @app.route('/routing/toggle', methods=['POST'])
         def toggle_routing():
             """Toggle AI controller routing"""
@@ -535,7 +775,7 @@ class MCPContextServer:
         def routing_config():
             """Get or update routing configuration"""
             if request.method == 'GET':
-                return jsonify(asdict(self.routing))
+                return jsonify(self.routing.to_dict())
             
             data = request.get_json()
             if data:
@@ -546,14 +786,14 @@ class MCPContextServer:
                 if 'timeout' in data:
                     self.routing.timeout = data['timeout']
             
-            return jsonify(asdict(self.routing))
+            return jsonify(self.routing.to_dict())
         
         @app.route('/routing/status', methods=['GET'])
         def routing_status():
             """Check routing status and connection"""
             status = {
                 "enabled": self.routing.ai_enabled,
-                "config": asdict(self.routing),
+                "config": self.routing.to_dict(),
                 "connection_test": None
             }
             
@@ -570,6 +810,20 @@ class MCPContextServer:
         api_thread.start()
         self.logger.info(f"🌐 HTTP API started on port {port}")
         self.logger.info(f"📡 Routing endpoints: /routing/toggle, /routing/status, /routing/config")
+        self.logger.info(f"📊 Stats endpoints: /stats, /flush")
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(message: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when installed"""
+    return orjson.dumps(message) if orjson is not None else json.dumps(message).encode()
+
+def _write_message(message: Any):
+    """Write one newline-framed JSON-RPC message to stdout in a single write"""
+    sys.stdout.buffer.write(_json_dumps(message) + b"\n")
+    sys.stdout.buffer.flush()
 
 async def main():
     """Main entry point"""
@@ -582,61 +836,60 @@ async def main():
                        help="Transport method")
     parser.add_argument("--api-port", type=int, default=8002,
                        help="HTTP API server port for routing control")
+    parser.add_argument("--flush-every", type=int, default=8,
+                       help="Buffer this many messages per conversation before writing (1 = write immediately)")
+    parser.add_argument("--test-mode", action="store_true",
+                       help="Open the database without fsync or an on-disk journal (throwaway test databases only)")
     
     args = parser.parse_args()
     
     # Create context server
-    server = MCPContextServer(args.db_path, args.llm_port)
+    server = MCPContextServer(args.db_path, args.llm_port, args.flush_every,
+                              durable=not args.test_mode)
+    
+    # Exit normally on SIGTERM so the atexit flush runs once the stack has
+    # unwound; flushing here could deadlock on a lock the interrupted code holds
+    def handle_sigterm(signum, frame):
+        sys.exit(0)
+    
+    signal.signal(signal.SIGTERM, handle_sigterm)
     
     # Start HTTP API for routing control
     server.setup_http_api(args.api_port)
     
     if args.transport == "stdio":
         # STDIO transport for MCP clients
-        import sys
-        
         while True:
             try:
                 line = sys.stdin.readline()
                 if not line:
                     break
                 
-                request = json.loads(line.strip())
-                method = request.get("method", "")
-                params = request.get("params", {})
+                request = _json_loads(line)
                 
-                # Route MCP methods
-                if method == "initialize":
-                    result = await server.handle_initialize(params)
-                elif method == "resources/list":
-                    result = await server.handle_resources_list(params)
-                elif method == "resources/read":
-                    result = await server.handle_resources_read(params)
-                elif method == "tools/list":
-                    result = await server.handle_tools_list(params)
-                elif method == "tools/call":
-                    result = await server.handle_tools_call(params)
+                # JSON-RPC batch: answer an array of requests with one array of responses
+                if isinstance(request, list):
+                    if request:
+                        response = [await server.handle_request(r) for r in request]
+                    else:
+                        response = {
+                            "jsonrpc": "2.0",
+                            "id": None,
+                            "error": {"code": -32600, "message": "Invalid Request: empty batch"}
+                        }
                 else:
-                    result = {"error": f"Unknown method: {method}"}
+                    response = await server.handle_request(request)
                 
                 # Send response
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "result": result
-                }
-                
-                print(json.dumps(response))
-                sys.stdout.flush()
+                _write_message(response)
                 
             except Exception as e:
                 error_response = {
                     "jsonrpc": "2.0", 
-                    "id": request.get("id") if 'request' in locals() else None,
+                    "id": None,
                     "error": {"code": -32603, "message": str(e)}
                 }
-                print(json.dumps(error_response))
-                sys.stdout.flush()
+                _write_message(error_response)
     
     else:
         print("SSE transport not implemented yet")
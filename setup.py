@@ -49,6 +49,9 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.950",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -10,10 +10,16 @@ import json
 import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
-from backend.mlx_controller import MLXController, GenerationParams
+from backend.mlx_controller import MLXController, GenerationParams, COMMON_MODELS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
@@ -22,6 +28,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON body, using orjson when installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(payload: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when installed"""
+    return orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+def _sse_event(payload: Any) -> bytes:
+    """Encode one server-sent event as bytes"""
+    return _SSE_PREFIX + _json_dumps(payload) + _SSE_SUFFIX
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Build a JSON response, using orjson when installed"""
+    return Response(_json_dumps(payload), status=status, mimetype='application/json')
+
 @dataclass
 class RoutingConfig:
     """Configuration for context database routing"""
@@ -29,6 +54,14 @@ class RoutingConfig:
     context_host: str = "localhost"
     context_port: int = 8001
     timeout: int = 5
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "context_enabled": self.context_enabled,
+            "context_host": self.context_host,
+            "context_port": self.context_port,
+            "timeout": self.timeout
+        }
 
 class StandaloneMLXController:
     """Standalone MLX Controller with optional context routing"""
@@ -37,6 +70,12 @@ class StandaloneMLXController:
         self.mlx_controller = MLXController()
         self.routing = RoutingConfig()
         self.current_params = GenerationParams()  # Store current parameters
+        
+        # Keep-alive connection pool for context database calls
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+        self._http.headers.update({"Content-Type": "application/json"})
+        
         self.app = Flask(__name__)
         CORS(self.app)
         self.setup_routes()
@@ -62,23 +101,8 @@ class StandaloneMLXController:
         def list_models():
             """List available models"""
             # Direct implementation to avoid method call issues
-            common_models = [
-                "mlx-community/Qwen2.5-0.5B-Instruct-4bit",
-                "mlx-community/Qwen2.5-1.5B-Instruct-4bit", 
-                "mlx-community/Qwen2.5-3B-Instruct-4bit",
-                "mlx-community/DeepSeek-R1-0528-Qwen3-8B-4bit",
-                "mlx-community/deepseek-coder-1.3b-instruct-mlx",
-                "mlx-community/deepseek-coder-6.7b-instruct-hf-4bit-mlx",
-                "mlx-community/Mistral-7B-Instruct-v0.3-4bit",
-                "mlx-community/Llama-3.2-1B-Instruct-4bit",
-                "mlx-community/Llama-3.2-3B-Instruct-4bit",
-                "mlx-community/gemma-2-2b-it-4bit",
-                "mlx-community/Phi-3.5-mini-instruct-4bit",
-                "microsoft/Phi-3.5-mini-instruct"
-            ]
-            
-            return jsonify({
-                "available_models": common_models,
+            return _json_response({
+                "available_models": COMMON_MODELS,
                 "current_model": self.mlx_controller.model_name,
                 "model_loaded": self.mlx_controller.model_loaded
             })
@@ -93,7 +117,7 @@ class StandaloneMLXController:
                 return jsonify({"error": "model_path is required"}), 400
             
             try:
-                success = self.mlx_controller.load_model(model_path)
+                success = self.mlx_controller.load_model(model_path, draft_model=data.get('draft_model_path'))
                 return jsonify({
                     "success": success,
                     "model_path": model_path,
@@ -153,7 +177,7 @@ class StandaloneMLXController:
             
             try:
                 start_time = time.time()
-                result = self.mlx_controller.generate_text(messages, params)
+                result = self.mlx_controller.generate_text(messages, params, data.get('system_prefix_id'))
                 generation_time = time.time() - start_time
                 
                 # Store response in context database if routing enabled
@@ -170,7 +194,7 @@ class StandaloneMLXController:
                     "timestamp": time.time()
                 })
                 
-                return jsonify(result)
+                return _json_response(result)
                 
             except Exception as e:
                 logger.error(f"Generation failed: {e}")
@@ -278,12 +302,12 @@ class StandaloneMLXController:
             def generate():
                 try:
                     for chunk in self.mlx_controller.stream_generate_text(messages, params):
-                        yield f"data: {json.dumps(chunk)}\n\n"
+                        yield _sse_event(chunk)
                 except Exception as e:
                     error_chunk = {"error": str(e), "finished": True}
-                    yield f"data: {json.dumps(error_chunk)}\n\n"
+                    yield _sse_event(error_chunk)
             
-            return Response(generate(), mimetype='text/event-stream')
+            return Response(generate(), mimetype='text/event-stream', direct_passthrough=True)
         
         # Routing Control Endpoints
         @self.app.route('/routing/toggle', methods=['POST'])
@@ -316,7 +340,7 @@ class StandaloneMLXController:
         def routing_config():
             """Get or update routing configuration"""
             if request.method == 'GET':
-                return jsonify(asdict(self.routing))
+                return jsonify(self.routing.to_dict())
             
             data = request.get_json()
             if data:
@@ -327,14 +351,14 @@ class StandaloneMLXController:
                 if 'timeout' in data:
                     self.routing.timeout = data['timeout']
             
-            return jsonify(asdict(self.routing))
+            return jsonify(self.routing.to_dict())
         
         @self.app.route('/routing/status', methods=['GET'])
         def routing_status():
             """Check routing status and connection"""
             status = {
                 "enabled": self.routing.context_enabled,
-                "config": asdict(self.routing),
+                "config": self.routing.to_dict(),
                 "connection_test": None
             }
             
@@ -347,14 +371,14 @@ class StandaloneMLXController:
         """Fetch context-enhanced messages from context database"""
         try:
             context_url = f"http://{self.routing.context_host}:{self.routing.context_port}/context/{conversation_id}/enhance"
-            response = requests.post(
+            response = self._http.post(
                 context_url,
                 json={"messages": messages},
                 timeout=self.routing.timeout
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 return result.get('enhanced_messages', messages)
             else:
                 logger.warning(f"Context enhancement failed: {response.status_code}")
@@ -368,7 +392,7 @@ class StandaloneMLXController:
         """Store conversation in context database"""
         try:
             context_url = f"http://{self.routing.context_host}:{self.routing.context_port}/context/{conversation_id}/store"
-            requests.post(
+            self._http.post(
                 context_url,
                 json={
                     "user_message": user_message,
@@ -383,7 +407,7 @@ class StandaloneMLXController:
         """Test connection to context database"""
         try:
             context_url = f"http://{self.routing.context_host}:{self.routing.context_port}/health"
-            response = requests.get(context_url, timeout=self.routing.timeout)
+            response = self._http.get(context_url, timeout=self.routing.timeout)
             return response.status_code == 200
         except Exception:
             return False
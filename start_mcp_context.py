@@ -3,17 +3,54 @@
 MCP Context Server Launcher - Personal Research & Study Context Management
 """
 
+import copy
 import json
 import sys
 import os
 import argparse
+import threading
+from collections import namedtuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Server script next to this launcher, independent of the working directory
+_HERE = Path(__file__).resolve().parent
+_SERVER_SCRIPT = _HERE / "mcp_context_server.py"
+
+# Effective launch settings after command line overrides are applied
+Effective = namedtuple("Effective", "db_path llm_port api_port transport")
+
+def _json_loads(data: bytes) -> dict:
+    """Parse JSON, using orjson when installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(config: dict) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+# Parsed configs keyed by path, valid while (st_mtime_ns, st_size) match
+_CFG_CACHE: dict = {}
+_CFG_LOCK = threading.Lock()
+
 def load_config(config_path: str = "mcp_config.json") -> dict:
     """Load MCP configuration"""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        stat = os.stat(config_path)
+        with _CFG_LOCK:
+            cached = _CFG_CACHE.get(config_path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return copy.deepcopy(cached[2])
+            
+            data = Path(config_path).read_bytes()
+            config = _json_loads(data)
+            _CFG_CACHE[config_path] = (stat.st_mtime_ns, stat.st_size, config)
+            return copy.deepcopy(config)
     except FileNotFoundError:
         print(f"❌ Config file not found: {config_path}")
         return {}
@@ -25,13 +62,15 @@ def setup_database_location(config: dict) -> str:
     """Setup database location with user choice"""
     current_path = config.get("database", {}).get("path", "./context_data/conversations.db")
     
-    print("🗄️  Database Location Setup")
-    print("=" * 40)
-    print(f"Current: {current_path}")
-    print("\nOptions:")
-    print("1. Keep current location")
-    print("2. Choose custom location")
-    print("3. Use default location")
+    sys.stdout.write("\n".join([
+        "🗄️  Database Location Setup",
+        "=" * 40,
+        f"Current: {current_path}",
+        "\nOptions:",
+        "1. Keep current location",
+        "2. Choose custom location",
+        "3. Use default location",
+    ]) + "\n")
     
     choice = input("\nSelect option (1-3): ").strip()
     
@@ -50,22 +89,23 @@ def setup_llm_port(config: dict) -> int:
     """Setup LLM port with user choice"""
     current_port = config.get("llm", {}).get("port", 8000)
     
-    print(f"\n🔌 LLM Connection Setup")
-    print("=" * 40)
-    print(f"Current port: {current_port}")
-    print("\nCommon ports:")
-    print("- 8000: Default MLX LLM Controller")
-    print("- 3000: Alternative MLX Frontend")
-    print("- 5000: Flask development")
-    print("- 8080: Alternative HTTP")
+    sys.stdout.write("\n".join([
+        "\n🔌 LLM Connection Setup",
+        "=" * 40,
+        f"Current port: {current_port}",
+        "\nCommon ports:",
+        "- 8000: Default MLX LLM Controller",
+        "- 3000: Alternative MLX Frontend",
+        "- 5000: Flask development",
+        "- 8080: Alternative HTTP",
+    ]) + "\n")
     
     new_port = input(f"\nEnter LLM port [{current_port}]: ").strip()
     
     if new_port:
-        try:
+        if new_port.isdecimal() and 0 < int(new_port) < 65536:
             return int(new_port)
-        except ValueError:
-            print("❌ Invalid port number, using default")
+        print("❌ Invalid port number, using default")
     
     return current_port
 
@@ -83,12 +123,14 @@ def main():
     
     # Load configuration
     config = load_config(args.config)
+    original_config = copy.deepcopy(config)
     
     print("🔗 MCP Context Server - Personal Research & Study")
     print("=" * 50)
     
-    # Interactive setup
-    if args.setup or not config:
+    # Interactive setup, unless the command line already supplies every value
+    overrides_complete = args.db_path is not None and args.llm_port is not None
+    if args.setup or (not config and not overrides_complete):
         print("Running interactive setup...\n")
         
         # Setup database location
@@ -98,45 +140,66 @@ def main():
         llm_port = setup_llm_port(config)
         
         # Update config
-        config["database"]["path"] = db_path
-        config["llm"]["port"] = llm_port
+        config.setdefault("database", {})["path"] = db_path
+        config.setdefault("llm", {})["port"] = llm_port
         
-        # Save updated config
-        with open(args.config, 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        print(f"\n✅ Configuration saved to {args.config}")
-    
-    # Override with command line args
-    db_path = args.db_path or config.get("database", {}).get("path", "./context_data/conversations.db")
-    llm_port = args.llm_port or config.get("llm", {}).get("port", 8000)
-    
-    print(f"\n📊 Context Server Configuration:")
-    print(f"   Database: {db_path}")
-    print(f"   LLM Port: {llm_port}")
-    print(f"   API Port: {args.api_port}")
-    print(f"   Transport: {args.transport}")
+        # Save updated config, skipping the write when nothing changed
+        if config != original_config:
+            Path(args.config).write_bytes(_json_dumps(config))
+            
+            print(f"\n✅ Configuration saved to {args.config}")
+        else:
+            print(f"\n✅ Configuration unchanged")
+    else:
+        config.setdefault("database", {})
+        config.setdefault("llm", {})
+    
+    launch(resolve(args, config))
+
+def resolve(args: argparse.Namespace, config: dict) -> Effective:
+    """Resolve launch settings once, command line overrides taking precedence"""
+    database = config.get("database", {})
+    llm = config.get("llm", {})
+    return Effective(
+        db_path=args.db_path or database.get("path", "./context_data/conversations.db"),
+        llm_port=args.llm_port or llm.get("port", 8000),
+        api_port=args.api_port,
+        transport=args.transport
+    )
+
+def launch(eff: Effective):
+    """Start the MCP context server with resolved settings"""
+    sys.stdout.write("\n".join([
+        "\n📊 Context Server Configuration:",
+        f"   Database: {eff.db_path}",
+        f"   LLM Port: {eff.llm_port}",
+        f"   API Port: {eff.api_port}",
+        f"   Transport: {eff.transport}",
+    ]) + "\n")
     
     # Create database directory
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    
-    print(f"\n🚀 Starting MCP Context Server...")
-    print(f"   Use with any MCP client")
-    print(f"   Context management for research & study")
-    
-    # Start the server
-    import subprocess
-    cmd = [
-        sys.executable, 
-        "mcp_context_server.py",
-        "--db-path", db_path,
-        "--llm-port", str(llm_port),
-        "--api-port", str(args.api_port),
-        "--transport", args.transport
+    Path(eff.db_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    sys.stdout.write("\n".join([
+        "\n🚀 Starting MCP Context Server...",
+        "   Use with any MCP client",
+        "   Context management for research & study",
+    ]) + "\n")
+    sys.stdout.flush()
+    
+    # Start the server in this interpreter instead of spawning a new one
+    import runpy
+    server_script = str(_SERVER_SCRIPT)
+    sys.argv = [
+        server_script,
+        "--db-path", eff.db_path,
+        "--llm-port", str(eff.llm_port),
+        "--api-port", str(eff.api_port),
+        "--transport", eff.transport
     ]
     
     try:
-        subprocess.run(cmd)
+        runpy.run_path(server_script, run_name="__main__")
     except KeyboardInterrupt:
         print("\n🛑 MCP Context Server stopped")
     except Exception as e: